@@ -1,4 +1,15 @@
+import argparse
+import contextlib
+import gzip
+import io
 import json
+import queue
+import re
+import tempfile
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
 from pathlib import Path
 from abc import ABC, abstractmethod
 
@@ -82,15 +93,233 @@ class FullTimeEmployee(Employee):
         }
 
 
+# Backup Manager: compressed snapshots plus incremental deltas, written in the background
+class BackupManager:
+    STAMP_FORMAT = "%Y%m%dT%H%M%S%f"
+    # Local time only, YYYY-MM-DD[ HH[:MM[:SS[.ffffff]]]]
+    TIME_PATTERN = re.compile(r"(\d{4})-(\d{2})-(\d{2})(?:[ T](\d{2})(?::(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?)?)?")
+
+    def __init__(self, folder, snapshot_every=10, keep_snapshots=5):
+        self.folder = Path(folder)
+        self.snapshot_every = snapshot_every    # deltas written before the next full snapshot
+        self.keep_snapshots = keep_snapshots    # snapshots (and their deltas) kept on disk
+        self.last_state = None
+        self.deltas_since_snapshot = 0
+        self.jobs = queue.Queue()
+        self.closed = False
+        self.errors = []                  # failures from the worker, reported by the main thread
+        self.write_lock = threading.Lock()
+        self.worker = threading.Thread(target=self.run, daemon=True)
+        self.worker.start()
+
+    def copy_state(self, employees):
+        return {emp_type: {emp_id: dict(emp_data) for emp_id, emp_data in emp_dict.items()}
+                for emp_type, emp_dict in employees.items()}
+
+    # Called from the interactive thread: copy the roster and hand it to the worker
+    def schedule(self, employees, snapshot=False):
+        if self.closed:
+            return
+        self.jobs.put((self.write_backup, datetime.now().strftime(self.STAMP_FORMAT), self.copy_state(employees), snapshot))
+
+    # Called once the roster has loaded, so the state before the first change is kept
+    def schedule_baseline(self, employees):
+        if self.closed:
+            return
+        self.jobs.put((self.write_baseline, datetime.now().strftime(self.STAMP_FORMAT), self.copy_state(employees)))
+
+    # Write a snapshot before returning; gives the error message, or None on success
+    def snapshot_now(self, employees):
+        self.flush()
+        try:
+            with self.write_lock:
+                self.write_backup(datetime.now().strftime(self.STAMP_FORMAT), self.copy_state(employees), True)
+        except Exception as error:
+            return str(error)
+        return None
+
+    # Wait until every scheduled backup has been written
+    def flush(self):
+        if self.worker.is_alive():
+            self.jobs.join()
+
+    def pop_errors(self):
+        errors, self.errors = self.errors, []
+        return errors
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.jobs.put(None)
+            self.flush()
+
+    def run(self):
+        while True:
+            job = self.jobs.get()
+            try:
+                if job is None:
+                    break
+                method, *args = job
+                with self.write_lock:
+                    method(*args)
+            except Exception as error:
+                self.errors.append(str(error))
+            finally:
+                self.jobs.task_done()
+
+    def write_backup(self, stamp, state, snapshot):
+        self.folder.mkdir(exist_ok=True)
+
+        if snapshot or self.last_state is None or self.deltas_since_snapshot >= self.snapshot_every:
+            self.write_file(stamp, "snapshot", state)
+            self.deltas_since_snapshot = 0
+            self.apply_retention()
+        else:
+            delta = self.make_delta(self.last_state, state)
+            if not delta["changed"] and not delta["removed"]:
+                return
+            self.write_file(stamp, "delta", delta)
+            self.deltas_since_snapshot += 1
+
+        self.last_state = state
+
+    # Snapshot the loaded roster unless the latest backup already matches it,
+    # so the first delta of a session describes the real change
+    def write_baseline(self, stamp, state):
+        if self.build_state() == state:
+            self.last_state = state
+        else:
+            self.write_backup(stamp, state, True)
+
+    # json.dump encodes in chunks, so the gzip stream never holds the whole file at once
+    def write_file(self, stamp, kind, data):
+        path = self.folder / f"{stamp}-{kind}.json.gz"
+        temp_path = path.with_suffix(".tmp")
+        with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+            json.dump(data, f)
+        temp_path.replace(path)
+
+    def read_file(self, path):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+
+    def make_delta(self, old, new):
+        changed = {}
+        removed = {}
+        for emp_type, emp_dict in new.items():
+            old_dict = old.get(emp_type, {})
+            updates = {emp_id: emp_data for emp_id, emp_data in emp_dict.items()
+                       if old_dict.get(emp_id) != emp_data}
+            gone = [emp_id for emp_id in old_dict if emp_id not in emp_dict]
+            if updates:
+                changed[emp_type] = updates
+            if gone:
+                removed[emp_type] = gone
+        return {"changed": changed, "removed": removed}
+
+    def apply_delta(self, state, delta):
+        for emp_type, updates in delta["changed"].items():
+            state.setdefault(emp_type, {}).update(updates)
+        for emp_type, gone in delta["removed"].items():
+            for emp_id in gone:
+                state.get(emp_type, {}).pop(emp_id, None)
+
+    # Returns (stamp, kind, path) for every backup, oldest first
+    def list_backups(self):
+        backups = []
+        for path in sorted(self.folder.glob("*.json.gz")):
+            stamp, _, kind = path.name.removesuffix(".json.gz").partition("-")
+            backups.append((stamp, kind, path))
+        return backups
+
+    def apply_retention(self):
+        snapshots = [stamp for stamp, kind, _ in self.list_backups() if kind == "snapshot"]
+        if len(snapshots) <= self.keep_snapshots:
+            return
+        oldest_kept = snapshots[-self.keep_snapshots]
+        for stamp, _, path in self.list_backups():
+            if stamp < oldest_kept:
+                path.unlink()
+
+    # Rebuild the roster as it was at point_in_time (latest backup if None)
+    def restore(self, point_in_time=None):
+        self.flush()
+        return self.build_state(point_in_time)
+
+    def build_state(self, point_in_time=None):
+        target = point_in_time.strftime(self.STAMP_FORMAT) if point_in_time else None
+        backups = [b for b in self.list_backups() if target is None or b[0] <= target]
+
+        base = None
+        for i, (stamp, kind, path) in enumerate(backups):
+            if kind == "snapshot":
+                base = i
+        if base is None:
+            return None
+
+        state = self.read_file(backups[base][2])
+        for stamp, kind, path in backups[base + 1:]:
+            self.apply_delta(state, self.read_file(path))
+        return state
+
+    # Read a typed time as the end of the unit it names, so "13:23:18" includes
+    # every backup taken during that second (stamps carry microseconds)
+    def parse_point_in_time(self, text):
+        match = self.TIME_PATTERN.fullmatch(text)
+        if not match:
+            raise ValueError(f"expected YYYY-MM-DD HH:MM:SS, got '{text}'")
+        year, month, day, hour, minute, second, fraction = match.groups()
+
+        point_in_time = datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0),
+                                 int(second or 0), int((fraction or "0").ljust(6, "0")))
+        if fraction:
+            return point_in_time
+        if second:
+            unit = timedelta(seconds=1)
+        elif minute:
+            unit = timedelta(minutes=1)
+        elif hour:
+            unit = timedelta(hours=1)
+        else:
+            unit = timedelta(days=1)
+        return point_in_time + unit - timedelta(microseconds=1)
+
+    def format_stamp(self, stamp):
+        return datetime.strptime(stamp, self.STAMP_FORMAT).strftime("%Y-%m-%d %H:%M:%S")
+
+
+# Raised when a replayed session no longer matches what the engine asks for
+class ReplayDivergence(Exception):
+    pass
+
+
 # Main System Class
 class EmployeeManagementSystem:
-    def __init__(self):
-        self.path = Path("employees.json")
+    def __init__(self, fast_start=False, data_file="employees.json"):
+        self.start_time = time.perf_counter()
+        self.startup_ms = None
+        self.path = Path(data_file)
+        self.index_path = self.path.with_suffix(".index.json")
+        self.backups = BackupManager(self.path.with_name(self.path.stem + "_backups"))
         self.employees = {"Part-Time Employees": {}, "Full-Time Employees": {}}
         self.part_id = 1
         self.full_id = 1
         self.running = True
-        self.load_data()
+        self.fast_start = fast_start
+        self.index_loaded = False
+        self.data_ready = threading.Event()
+        self.load_error = None
+        self.recording = None   # list of commands while recording a session
+        self.script = None      # queue of pending inputs while replaying a session
+        self.unchecked_input = None   # last replayed value that had no recorded prompt
+
+        # Fast-start: read the small index now, load the full roster in the background
+        if fast_start:
+            self.index_loaded = self.load_index()
+            threading.Thread(target=self.load_in_background, daemon=True).start()
+        else:
+            self.load_data()
+            self.data_ready.set()
 
     # For Decoration
     def decorate(self, text):
@@ -98,47 +327,152 @@ class EmployeeManagementSystem:
         print("\t" + text)
         print("=" * 45)
 
+    # Every operator input goes through here so sessions can be recorded and replayed
+    def read_input(self, prompt):
+        if self.script is not None:
+            return self.replay_input(prompt)
+        value = input(prompt)
+        if self.recording is not None:
+            self.recording[-1].append([self.prompt_key(prompt), value])
+        return value
+
+    # Prompts are logged without the current field values, which depend on the data
+    def prompt_key(self, prompt):
+        return prompt.strip().split(" (")[0]
+
+    # Recorded entries are [prompt, value]; hand-written logs may give bare values
+    def replay_input(self, prompt):
+        if not self.script:
+            raise EOFError("Session log ran out of input.")
+        entry = self.script.popleft()
+        if isinstance(entry, list):
+            expected, value = entry
+            if expected != self.prompt_key(prompt):
+                raise ReplayDivergence(f"log has input for '{expected}' but the engine asked '{self.prompt_key(prompt)}'")
+            self.unchecked_input = None
+        else:
+            value = entry
+            self.unchecked_input = value
+        return value
+
+    # A bare log value rejected by a validator means the log and engine are out of step
+    def check_rejected_input(self, prompt):
+        if self.script is not None and self.unchecked_input is not None:
+            raise ReplayDivergence(f"'{self.unchecked_input}' was rejected at '{self.prompt_key(prompt)}'")
+
     # Input Validators
     def valid_integer(self, prompt):
         while True:
             try:
-                return int(input(prompt))
+                return int(self.read_input(prompt))
             except ValueError:
+                self.check_rejected_input(prompt)
                 print("\n\t[!] Please enter a valid integer.")
 
     def valid_float(self, prompt):
         while True:
             try:
-                return float(input(prompt))
+                return float(self.read_input(prompt))
             except ValueError:
+                self.check_rejected_input(prompt)
                 print("\n\t[!] Please enter a valid number.")
 
     # File Handling
     def load_data(self):
         if self.path.exists():
             with open(self.path, "r") as f:
-                self.employees = json.load(f)
+                employees = json.load(f)
 
             # Update part-time and full-time IDs based on existing data
-            part_ids = self.employees["Part-Time Employees"].keys()
-            full_ids = self.employees["Full-Time Employees"].keys()
+            # (never lower a counter that the index already moved forward)
+            part_ids = employees["Part-Time Employees"].keys()
+            full_ids = employees["Full-Time Employees"].keys()
 
             if part_ids:
-                self.part_id = max(map(int, part_ids)) + 1
+                self.part_id = max(self.part_id, max(map(int, part_ids)) + 1)
             if full_ids:
-                self.full_id = max(map(int, full_ids)) + 1
-        else:
-            self.save_data()
+                self.full_id = max(self.full_id, max(map(int, full_ids)) + 1)
 
+            # Only a roster that passed the checks above replaces the current one
+            self.employees = employees
+            self.backups.schedule_baseline(employees)
+        else:
+            self.write_files()
+
+    # Keep the error for wait_for_data() instead of printing a traceback over the menu.
+    # data_ready is set last, so a waiting reader always sees the error if there is one.
+    def load_in_background(self):
+        try:
+            self.load_data()
+        except Exception as error:
+            self.load_error = error
+        finally:
+            self.data_ready.set()
+
+    # Sidecar index: ID counters plus the size and mtime of the data file they describe
+    def data_signature(self):
+        stat = self.path.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def load_index(self):
+        if not self.index_path.exists() or not self.path.exists():
+            return False
+        try:
+            with open(self.index_path, "r") as f:
+                index = json.load(f)
+            # A data file changed without its index (manual edit, other script) makes it stale
+            if index["data_file"] != self.data_signature():
+                return False
+            part_id, full_id = index["part_id"], index["full_id"]
+        except (ValueError, KeyError, TypeError, OSError):
+            return False
+        self.part_id = part_id
+        self.full_id = full_id
+        return True
+
+    def save_index(self):
+        index = {
+            "part_id": self.part_id,
+            "full_id": self.full_id,
+            "data_file": self.data_signature()
+        }
+        with open(self.index_path, "w") as f:
+            json.dump(index, f)
 
-    def save_data(self):
+    def next_id(self, choice):
+        if choice == 1:
+            emp_id = str(self.part_id)
+            self.part_id += 1
+        else:
+            emp_id = str(self.full_id)
+            self.full_id += 1
+        return emp_id
+
+    # Block until the background load has finished (no-op in normal mode).
+    # A failed load stops the program, as it does at startup in normal mode,
+    # so an empty roster is never saved over the data file.
+    def wait_for_data(self):
+        if not self.data_ready.is_set():
+            print("\n\tLoading employee records...")
+            self.data_ready.wait()
+        if self.load_error is not None:
+            raise SystemExit(f"\n\t[!] Could not load {self.path}: {self.load_error}")
+
+    def write_files(self):
         with open(self.path, "w") as f:
             json.dump(self.employees, f, indent=4)
+        self.save_index()
+
+    def save_data(self):
+        self.wait_for_data()
+        self.write_files()
+        self.backups.schedule(self.employees)
 
     def get_employee_type_key(self, choice):
         return "Part-Time Employees" if choice == 1 else "Full-Time Employees"
 
     def display_records(self, emp_type_key):
+        self.wait_for_data()
         emp_dict = self.employees.get(emp_type_key, {})
         if not emp_dict:
             print(f"\n\tNo {emp_type_key} records found.")
@@ -161,24 +495,30 @@ class EmployeeManagementSystem:
             match choice:
                 case 1 | 2:
                     print("\n\t--- Employee Details ---")
-                    name = input("\tEnter Name: ").strip().title()
+                    name = self.read_input("\tEnter Name: ").strip().title()
                     age = self.valid_integer("\tEnter Age: ")
-                    gender = input("\tEnter Gender: ").strip().title()
-                    position = input("\tEnter Position: ").strip().title()
+                    gender = self.read_input("\tEnter Gender: ").strip().title()
+                    position = self.read_input("\tEnter Position: ").strip().title()
                     salary = self.valid_float("\tEnter Salary: ")
                     emp_type_key = self.get_employee_type_key(choice)
 
+                    # Without an index the counters are only known once the roster is loaded
+                    if not self.index_loaded:
+                        self.wait_for_data()
+
                     if choice == 1:
                         hourly_rate = self.valid_float("\tEnter Hourly Rate: ")
                         hours_worked = self.valid_integer("\tEnter Hours Worked: ")
                         emp = PartTimeEmployee(name, age, gender, position, salary, hourly_rate, hours_worked)
-                        emp_id = str(self.part_id)
-                        self.part_id += 1
                     else:
                         bonus = self.valid_float("\tEnter Monthly Bonus Pay: ")
                         emp = FullTimeEmployee(name, age, gender, position, salary, bonus)
-                        emp_id = str(self.full_id)
-                        self.full_id += 1
+                    emp_id = self.next_id(choice)
+
+                    # The loaded roster wins over the index: never overwrite an existing ID
+                    self.wait_for_data()
+                    if emp_id in self.employees[emp_type_key]:
+                        emp_id = self.next_id(choice)
 
                     self.employees[emp_type_key][emp_id] = emp.display_info()
                     self.save_data()
@@ -200,6 +540,7 @@ class EmployeeManagementSystem:
 
             match choice:
                 case 1:
+                    self.wait_for_data()
                     for emp_type in self.employees:
                         self.display_records(emp_type)
                 case 2:
@@ -220,7 +561,8 @@ class EmployeeManagementSystem:
 
             match choice:
                 case 1:
-                    keyword = input("\tEnter name or position: ").strip().lower()
+                    keyword = self.read_input("\tEnter name or position: ").strip().lower()
+                    self.wait_for_data()
                     found = False
                     for emp_type, emp_dict in self.employees.items():
                         for emp_id, emp_data in emp_dict.items():
@@ -250,13 +592,14 @@ class EmployeeManagementSystem:
                     print("\t2. Full-Time")
                     emp_choice = self.valid_integer("\n\tEnter type: ")
                     emp_type_key = self.get_employee_type_key(emp_choice)
+                    self.wait_for_data()
 
                     if not self.employees[emp_type_key]:
                         print(f"\n\tNo {emp_type_key} data found.")
                         continue
 
                     self.display_records(emp_type_key)
-                    emp_id = input("\n\tEnter Employee ID to update: ").strip()
+                    emp_id = self.read_input("\n\tEnter Employee ID to update: ").strip()
 
                     if emp_id not in self.employees[emp_type_key]:
                         print("\n\t[!] Employee ID not found.")
@@ -266,7 +609,7 @@ class EmployeeManagementSystem:
                     print("\n\tLeave blank to skip a field.")
 
                     for field in list(emp_data.keys())[1:]:
-                        new_value = input(f"\tNew {field} (current: {emp_data[field]}): ").strip()
+                        new_value = self.read_input(f"\tNew {field} (current: {emp_data[field]}): ").strip()
                         if new_value:
                             emp_data[field] = float(new_value) if field in ("Salary", "Hourly Rate", "Monthly Bonus Pay") else new_value.title()
 
@@ -285,13 +628,20 @@ class EmployeeManagementSystem:
             print("\t3. Delete Individual Record")
             print("\t4. Back to Main Menu")
             choice = self.valid_integer("\n\tEnter choice: ")
+            self.wait_for_data()
 
             match choice:
                 case 1:
                     if self.path.exists():
+                        # The file is only removed once a snapshot of it is safely on disk
+                        error = self.backups.snapshot_now(self.employees)
+                        if error:
+                            print(f"\n\t[!] Backup failed, file not deleted: {error}")
+                            continue
                         self.path.unlink()
+                        self.index_path.unlink(missing_ok=True)
                         self.employees = {"Part-Time Employees": {}, "Full-Time Employees": {}}
-                        print("\n\tFile deleted successfully.")
+                        print("\n\tFile deleted successfully. A backup snapshot was kept.")
                     else:
                         print("\n\t[!] No JSON file found.")
                 case 2:
@@ -310,7 +660,7 @@ class EmployeeManagementSystem:
                         continue
 
                     self.display_records(emp_type_key)
-                    emp_id = input("\n\tEnter Employee ID to delete: ").strip()
+                    emp_id = self.read_input("\n\tEnter Employee ID to delete: ").strip()
                     if emp_id in self.employees[emp_type_key]:
                         del self.employees[emp_type_key][emp_id]
                         self.save_data()
@@ -322,7 +672,59 @@ class EmployeeManagementSystem:
                 case _:
                     print("\n\t[!] Invalid choice.")
 
+    def report_backup_errors(self):
+        for error in self.backups.pop_errors():
+            print(f"\n\t[!] Backup failed: {error}")
+
+    def backup_menu(self):
+        while True:
+            self.report_backup_errors()
+            self.decorate("BACKUPS")
+            print("\t1. Back Up Now")
+            print("\t2. List Backups")
+            print("\t3. Restore")
+            print("\t4. Back to Main Menu")
+            choice = self.valid_integer("\n\tEnter choice: ")
+
+            match choice:
+                case 1:
+                    self.wait_for_data()
+                    self.backups.schedule(self.employees, snapshot=True)
+                    print("\n\tSnapshot scheduled.")
+                case 2:
+                    self.backups.flush()
+                    self.report_backup_errors()
+                    backups = self.backups.list_backups()
+                    if not backups:
+                        print("\n\tNo backups found.")
+                    for stamp, kind, path in backups:
+                        print(f"\t  {self.backups.format_stamp(stamp)}  {kind:<8}  {path.stat().st_size} bytes")
+                case 3:
+                    text = self.read_input("\tRestore to (YYYY-MM-DD HH:MM:SS, blank for latest): ").strip()
+                    try:
+                        point_in_time = self.backups.parse_point_in_time(text) if text else None
+                    except (ValueError, OverflowError):
+                        print("\n\t[!] Invalid date and time.")
+                        continue
+
+                    state = self.backups.restore(point_in_time)
+                    if state is None:
+                        print("\n\t[!] No backup found for that time.")
+                        continue
+
+                    self.wait_for_data()
+                    self.employees = state
+                    self.save_data()
+                    self.load_data()
+                    print("\n\tEmployee records restored successfully.")
+                case 4:
+                    break
+                case _:
+                    print("\n\t[!] Invalid choice.")
+
     def exit_program(self):
+        self.backups.close()
+        self.report_backup_errors()
         print("\n" + "=" * 55)
         print("\tThank you for using the system! Goodbye.")
         print("=" * 55)
@@ -330,26 +732,133 @@ class EmployeeManagementSystem:
 
     def menu(self):
         while self.running:
+            self.report_backup_errors()
             self.decorate("EMPLOYEE MANAGEMENT SYSTEM")
             print("\t1. Add Employee")
             print("\t2. View Employees")
             print("\t3. Search Employee")
             print("\t4. Update Employee")
             print("\t5. Delete Employee")
-            print("\t6. Exit")
+            print("\t6. Backups")
+            print("\t7. Exit")
 
-            choice = self.valid_integer("\n\tEnter choice: ")
+            # Time-to-first-prompt, reported once in fast-start mode
+            if self.startup_ms is None:
+                self.startup_ms = (time.perf_counter() - self.start_time) * 1000
+                if self.fast_start:
+                    print(f"\n\t(Ready in {self.startup_ms:.1f} ms)")
 
-            match choice:
-                case 1: self.add_employee()
-                case 2: self.view_employee()
-                case 3: self.search_employee()
-                case 4: self.update_employee()
-                case 5: self.delete_employee()
-                case 6: self.exit_program()
-                case _: print("\n\t[!] Invalid choice.")
+            # Each main menu choice starts a new command in the session log
+            if self.recording is not None:
+                self.recording.append([])
+
+            choice = self.valid_integer("\n\tEnter choice: ")
+            self.run_command(choice)
+
+    def run_command(self, choice):
+        match choice:
+            case 1: self.add_employee()
+            case 2: self.view_employee()
+            case 3: self.search_employee()
+            case 4: self.update_employee()
+            case 5: self.delete_employee()
+            case 6: self.backup_menu()
+            case 7: self.exit_program()
+            case _: print("\n\t[!] Invalid choice.")
+
+    # Session Recording and Replay
+    def record_session(self, log_path):
+        self.recording = []
+        try:
+            self.menu()
+        finally:
+            # Drop the empty command left behind if input ended at the main menu
+            commands = [cmd for cmd in self.recording if cmd]
+            with open(log_path, "w") as f:
+                json.dump(commands, f, separators=(",", ":"))
+            self.recording = None
+            print(f"\n\tSession saved to {log_path} ({len(commands)} commands).")
+
+    def replay_session(self, log_path):
+        with open(log_path, "r") as f:
+            commands = json.load(f)
+
+        # Replay against a scratch copy of the roster with backups switched off, so the
+        # live data file and its rolling backups are never touched and the timings
+        # measure only the engine
+        self.wait_for_data()
+        live = (self.path, self.index_path, self.backups)
+        with tempfile.TemporaryDirectory() as scratch:
+            self.path = Path(scratch) / self.path.name
+            self.index_path = self.path.with_suffix(".index.json")
+            self.backups = BackupManager(Path(scratch) / "backups")
+            self.backups.close()
+            try:
+                self.write_files()
+                return self.replay_commands(commands)
+            finally:
+                self.path, self.index_path, self.backups = live
+
+    def replay_commands(self, commands):
+        labels = {1: "Add", 2: "View", 3: "Search", 4: "Update", 5: "Delete", 6: "Backups", 7: "Exit"}
+        timings = []
+        diverged = None
+        for number, inputs in enumerate(commands, start=1):
+            self.script = deque(inputs)
+            choice = None
+            start = time.perf_counter()
+            try:
+                # Menu output is discarded so only the engine is being timed
+                with contextlib.redirect_stdout(io.StringIO()):
+                    choice = self.valid_integer("\n\tEnter choice: ")
+                    self.run_command(choice)
+                if self.script:
+                    raise ReplayDivergence(f"{len(self.script)} logged inputs were never asked for")
+            except (EOFError, ReplayDivergence) as error:
+                # Later commands would run against the wrong state, so stop here
+                diverged = (number, labels.get(choice, "Invalid"), "DIVERGED", str(error))
+                break
+            except Exception as error:
+                # The engine itself crashed (e.g. a bad value in update_employee)
+                diverged = (number, labels.get(choice, "Invalid"), "FAILED", f"{type(error).__name__}: {error}")
+                break
+            finally:
+                self.script = None
+                self.unchecked_input = None
+            timings.append((number, labels.get(choice, "Invalid"), (time.perf_counter() - start) * 1000))
+            if not self.running:
+                break
+
+        self.decorate("REPLAY REPORT")
+        for number, label, elapsed in timings:
+            print(f"\t#{number:<5} {label:<8} {elapsed:10.3f} ms")
+        total = sum(elapsed for _, _, elapsed in timings)
+        print(f"\n\t{len(timings)} commands in {total:.3f} ms")
+        if diverged:
+            number, label, status, reason = diverged
+            print(f"\n\t[!] Command {number} ({label}) {status}: {reason}")
+            print("\t    Replay stopped; the timings above are for the commands that completed.")
+        return timings, diverged
 
 
 # Entry Point
 if __name__ == "__main__":
-    EmployeeManagementSystem().menu()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Employee Management System")
+    parser.add_argument("--fast", action="store_true", help="show the menu before the roster has loaded")
+    parser.add_argument("--data", default="employees.json", help="employee data file")
+    parser.add_argument("--record", metavar="LOG", help="record this session to a command log")
+    parser.add_argument("--replay", metavar="LOG", help="replay a command log against a scratch copy of the data and report timings")
+    args = parser.parse_args()
+
+    system = EmployeeManagementSystem(fast_start=args.fast, data_file=args.data)
+    try:
+        if args.replay:
+            system.replay_session(args.replay)
+        elif args.record:
+            system.record_session(args.record)
+        else:
+            system.menu()
+    finally:
+        # Finish any backups still being written
+        system.backups.close()
+        system.report_backup_errors()
\ No newline at end of file
@@ -0,0 +1,50 @@
+import json
+import tempfile
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from EMS_file_handling import EmployeeManagementSystem
+
+
+class BackupRestoreTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = Path(self.folder.name) / "e.json"
+        roster = {
+            "Part-Time Employees": {
+                "1": {"Type": "Part-Time", "Name": "Ann"},
+                "2": {"Type": "Part-Time", "Name": "Ben"}
+            },
+            "Full-Time Employees": {}
+        }
+        with open(self.path, "w") as f:
+            json.dump(roster, f)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_restore_brings_back_deleted_record(self):
+        system = EmployeeManagementSystem(data_file=str(self.path))
+        system.backups.flush()
+        time.sleep(0.01)
+        before_delete = datetime.now()
+        time.sleep(0.01)
+
+        # Delete Individual Record -> Part-Time -> ID 1 -> Back
+        answers = iter(["3", "1", "1", "4"])
+        with patch("builtins.input", lambda prompt="": next(answers)), patch("builtins.print"):
+            system.delete_employee()
+        system.backups.close()
+
+        self.assertEqual(list(system.employees["Part-Time Employees"]), ["2"])
+        restored = system.backups.restore(before_delete)
+        self.assertEqual(sorted(restored["Part-Time Employees"]), ["1", "2"])
+        self.assertEqual(list(system.backups.restore()["Part-Time Employees"]), ["2"])
+        self.assertEqual(system.backups.pop_errors(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()